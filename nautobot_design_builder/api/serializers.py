@@ -1,5 +1,7 @@
 """Serializers for design builder."""
 
+from functools import lru_cache
+
 from django.contrib.contenttypes.models import ContentType
 
 from drf_spectacular.utils import extend_schema_field
@@ -14,6 +16,12 @@ from nautobot.core.api.utils import get_serializer_for_model
 from nautobot_design_builder.models import Design, Deployment, ChangeSet, ChangeRecord
 
 
+@lru_cache(maxsize=None)
+def _get_serializer_for_model(model_class):
+    """Get (and memoize) the API serializer class for a model class."""
+    return get_serializer_for_model(model_class)
+
+
 class DesignSerializer(NautobotModelSerializer, TaggedModelSerializerMixin):
     """Serializer for the design model."""
 
@@ -73,7 +81,7 @@ class ChangeRecordSerializer(NautobotModelSerializer):
     def get_design_object(self, obj):
         """Get design object serialized."""
         if obj.design_object:
-            serializer = get_serializer_for_model(obj.design_object)
+            serializer = _get_serializer_for_model(type(obj.design_object))
             context = {"request": self.context["request"]}
             return serializer(obj.design_object, context=context).data
         return None
@@ -28,7 +28,8 @@ class DesignAPIViewSet(NautobotModelViewSet):
 class DeploymentAPIViewSet(NautobotModelViewSet):
     """API views for the design instance model."""
 
-    queryset = Deployment.objects.all()
+    # `Deployment.__str__` (the `display` field) reads `design.job.name`
+    queryset = Deployment.objects.select_related("design__job")
     serializer_class = DeploymentSerializer
     filterset_class = DeploymentFilterSet
 
@@ -44,6 +45,7 @@ class ChangeSetAPIViewSet(NautobotModelViewSet):
 class ChangeRecordAPIViewSet(NautobotModelViewSet):
     """API views for the change record model."""
 
-    queryset = ChangeRecord.objects.all()
+    # `ChangeRecordSerializer.get_design_object` serializes the related object
+    queryset = ChangeRecord.objects.prefetch_related("design_object")
     serializer_class = ChangeRecordSerializer
     filterset_class = ChangeRecordFilterSet
@@ -1,6 +1,7 @@
 """Extra action tags that are not part of the core Design Builder."""
 
-from functools import reduce
+from collections import defaultdict
+from functools import lru_cache, reduce
 import operator
 from typing import Any, Dict, Iterator, Tuple
 
@@ -10,6 +11,7 @@ from django.db.models import Q
 
 from nautobot.circuits import models as circuits
 from nautobot.dcim import models as dcim
+from nautobot.extras.models import Status
 from nautobot.ipam.models import Prefix
 
 import netaddr
@@ -20,6 +22,20 @@ from nautobot_design_builder.ext import AttributeExtension
 from nautobot_design_builder.jinja_filters import network_offset
 
 
+@lru_cache(maxsize=1024)
+def _parse_prefix(prefix_str: str) -> Tuple[int, netaddr.IPAddress, netaddr.IPAddress]:
+    """Parse a CIDR string into the `Prefix` fields used to look it up.
+
+    Args:
+        prefix_str (str): The prefix in CIDR notation.
+
+    Returns:
+        Tuple[int, IPAddress, IPAddress]: The prefix length, network and broadcast addresses.
+    """
+    prefix = netaddr.IPNetwork(prefix_str)
+    return prefix.prefixlen, prefix.network, prefix.broadcast
+
+
 class LookupMixin:
     """A helper mixin that provides a way to lookup objects."""
 
@@ -48,7 +64,7 @@ class LookupMixin:
             queryset = model_class.objects
         except ContentType.DoesNotExist:
             # pylint: disable=raise-missing-from
-            raise DesignImplementationError(f"Could not find model class for {model_class}")
+            raise DesignImplementationError(f"Could not find model class for {app_label}.{model_name}")
 
         return self.lookup(queryset, query)
 
@@ -216,6 +232,38 @@ class CableConnectionExtension(AttributeExtension, LookupMixin):
 
     tag = "connect_cable"
 
+    def __init__(self, environment: Environment):
+        """Initialize the CableConnectionExtension with an empty status cache."""
+        super().__init__(environment)
+        self._statuses = {}
+
+    def _get_status(self, query: dict, parent: ModelInstance) -> ModelInstance:
+        """Lookup the status for a cable.
+
+        Cable statuses are shared by many cables in a design and don't change
+        while the design is implemented, so each distinct status query is
+        only looked up once per environment.
+
+        Args:
+            query (dict): Status lookup (e.g. `{"name": "Planned"}`).
+
+            parent (ModelInstance): The termination the cable is being connected from.
+
+        Returns:
+            ModelInstance: The matching status.
+        """
+        try:
+            key = tuple(sorted(query.items()))
+            status = self._statuses.get(key)
+        except TypeError:
+            # unhashable query values, don't bother caching
+            return self.lookup(Status.objects, query, parent=parent)
+
+        if status is None:
+            status = self.lookup(Status.objects, query, parent=parent)
+            self._statuses[key] = status
+        return status
+
     @staticmethod
     def get_query_managers(endpoint_type):
         """Get the list of query managers for the `endpoint_type`.
@@ -296,6 +344,10 @@ class CableConnectionExtension(AttributeExtension, LookupMixin):
 
         cable_attributes = {**value}
         termination_query = cable_attributes.pop("to")
+        status_keys = [key for key in cable_attributes if key.startswith("status__")]
+        status_query = {key.split("__", 1)[1]: cable_attributes.pop(key) for key in status_keys}
+        if status_query:
+            cable_attributes["status"] = self._get_status(status_query, model_instance)
         remote_instance = None
         query_managers = self.get_query_managers(model_instance.model_class)
         while remote_instance is None:
@@ -313,20 +365,25 @@ class CableConnectionExtension(AttributeExtension, LookupMixin):
                 {
                     "!create_or_update:termination_a_id": model_instance.design_instance.id,
                     "!create_or_update:termination_a_type_id": ContentType.objects.get_for_model(
-                        model_instance.design_instance
+                        model_instance.model_class
                     ).id,
                     "!create_or_update:termination_b_id": remote_instance.design_instance.id,
                     "!create_or_update:termination_b_type_id": ContentType.objects.get_for_model(
-                        remote_instance.design_instance
+                        remote_instance.model_class
                     ).id,
                 }
             )
 
-            existing_cable = dcim.Cable.objects.filter(
-                Q(termination_a_id=model_instance.design_instance.id)
-                | Q(termination_b_id=remote_instance.design_instance.id)
-            ).first()
-            Cable = self.environment.model_factory(dcim.Cable)  # pylint:disable=invalid-name
+            # Only the IDs are needed to decide whether an existing cable must be replaced
+            existing_cable = (
+                dcim.Cable.objects.filter(
+                    Q(termination_a_id=model_instance.design_instance.id)
+                    | Q(termination_b_id=remote_instance.design_instance.id)
+                )
+                .only("id", "termination_a_id", "termination_b_id")
+                .first()
+            )
+            Cable = self.environment.model_class_index[dcim.Cable]  # pylint:disable=invalid-name
             if existing_cable:
                 if (
                     existing_cable.termination_a_id != model_instance.design_instance.id
@@ -398,22 +455,15 @@ class NextPrefixExtension(AttributeExtension):
         query = Q(**value)
         if "prefix" in value:
             prefixes = value.pop("prefix")
-            prefix_q = []
             if isinstance(prefixes, str):
                 prefixes = [prefixes]
             elif not isinstance(prefixes, list):
                 raise DesignImplementationError("Prefixes should be a string (single prefix) or a list.")
 
+            prefix_q = []
             for prefix_str in prefixes:
-                prefix_str = prefix_str.strip()
-                prefix = netaddr.IPNetwork(prefix_str)
-                prefix_q.append(
-                    Q(
-                        prefix_length=prefix.prefixlen,
-                        network=prefix.network,
-                        broadcast=prefix.broadcast,
-                    )
-                )
+                prefix_length, network, broadcast = _parse_prefix(prefix_str.strip())
+                prefix_q.append(Q(prefix_length=prefix_length, network=network, broadcast=broadcast))
             query = Q(**value) & reduce(operator.or_, prefix_q)
 
         prefixes = Prefix.objects.filter(query)
@@ -425,7 +475,7 @@ class NextPrefixExtension(AttributeExtension):
         """Return the next available prefix from a parent prefix.
 
         Args:
-            prefixes (str): Comma separated list of prefixes to search for available subnets.
+            prefixes (Iterable[Prefix]): Parent prefixes to search for available subnets.
 
             length (int): The requested prefix length.
 
@@ -433,10 +483,26 @@ class NextPrefixExtension(AttributeExtension):
             str: The next available prefix
         """
         length = int(length)
+        prefixes = list(prefixes)
+
+        # Fetch the children of every candidate parent in a single query rather
+        # than calling `get_available_prefixes()` (one query each) per parent.
+        children = defaultdict(list)
+        for parent_id, network, prefix_length in Prefix.objects.filter(parent__in=prefixes).values_list(
+            "parent_id", "network", "prefix_length"
+        ):
+            children[parent_id].append(f"{network}/{prefix_length}")
+
         for requested_prefix in prefixes:
-            for available_prefix in requested_prefix.get_available_prefixes().iter_cidrs():
-                if available_prefix.prefixlen <= length:
-                    return f"{available_prefix.network}/{length}"
+            available_prefixes = netaddr.IPSet([requested_prefix.prefix]) - netaddr.IPSet(children[requested_prefix.pk])
+            available_prefix = next(
+                (cidr for cidr in available_prefixes.iter_cidrs() if cidr.prefixlen <= length),
+                None,
+            )
+            if available_prefix is not None:
+                # CIDRs from an IPSet are aligned, so the first address is the network
+                network = netaddr.IPAddress(available_prefix.first, available_prefix.version)
+                return f"{network}/{length}"
         raise DesignImplementationError(f"No available prefixes could be found from {list(map(str, prefixes))}")
 
 
@@ -597,23 +663,20 @@ class BGPPeeringExtension(AttributeExtension):
         retval = {**value}
         endpoint_a = self.PeerEndpoint(self.environment, retval.pop("endpoint_a"))
         endpoint_z = self.PeerEndpoint(self.environment, retval.pop("endpoint_z"))
-        peering_a = None
-        peering_z = None
-        try:
-            peering_a = endpoint_a.design_instance.peering
-            peering_z = endpoint_z.design_instance.peering
-        except self.Peering.model_class.DoesNotExist:
-            pass
+        # Compare the peering foreign keys directly rather than loading each
+        # endpoint's peering. The `endpoint_z` peering is only considered
+        # when `endpoint_a` already belongs to a peering.
+        peering_a_id = endpoint_a.design_instance.peering_id
+        peering_z_id = endpoint_z.design_instance.peering_id if peering_a_id else None
 
         # try to prevent empty peerings
-        if peering_a == peering_z:
-            if peering_a:
-                retval["!update:pk"] = peering_a.pk
+        if peering_a_id == peering_z_id:
+            if peering_a_id:
+                retval["!update:pk"] = peering_a_id
         else:
-            if peering_a:
-                peering_a.delete()
-            if peering_z:
-                peering_z.delete()
+            stale_ids = {peering_a_id, peering_z_id} - {None}
+            for peering in self.Peering.model_class.objects.filter(pk__in=stale_ids):
+                peering.delete()
 
         retval["endpoints"] = [endpoint_a, endpoint_z]
         endpoint_a.design_metadata.attributes["peering"] = model_instance
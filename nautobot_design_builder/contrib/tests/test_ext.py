@@ -1,7 +1,18 @@
 """Unit tests related to template extensions."""
 
 import os
+from unittest.mock import patch
 
+import yaml
+
+from django.test import TestCase
+
+from nautobot.dcim.models import Cable, Interface
+from nautobot.extras.models import Status
+
+from nautobot_design_builder.contrib.ext import CableConnectionExtension, LookupMixin
+from nautobot_design_builder.design import Environment
+from nautobot_design_builder.errors import DoesNotExistError
 from nautobot_design_builder.tests.test_builder import BuilderTestCase
 
 
@@ -9,3 +20,49 @@ class TestContribExtensions(BuilderTestCase):
     """Test contrib extensions against any version of Nautobot."""
 
     data_dir = os.path.join(os.path.dirname(__file__), "testdata")
+
+
+class TestCableConnectionExtension(TestCase):
+    """Test the status handling of the `connect_cable` extension."""
+
+    @staticmethod
+    def load_design(filename):
+        """Load the first design from a contrib testdata file."""
+        with open(os.path.join(TestContribExtensions.data_dir, filename), encoding="utf-8") as file:
+            return yaml.safe_load(file)["designs"][0]
+
+    def implement_design(self, design):
+        """Implement `design` and return the number of `Status` lookups made by the extension."""
+        environment = Environment(extensions=[CableConnectionExtension])
+        with patch.object(LookupMixin, "lookup", autospec=True, side_effect=LookupMixin.lookup) as lookup:
+            with self.captureOnCommitCallbacks(execute=True):
+                environment.implement_design(design=design, commit=True)
+        return len([call for call in lookup.call_args_list if call.args[1].model is Status])
+
+    def test_status_lookup_is_cached(self):
+        """Test that cables sharing a status query only look it up once."""
+        design = self.load_design("cable_connections_shared_status.yaml")
+        self.assertEqual(1, self.implement_design(design))
+        self.assertEqual(2, Cable.objects.filter(status__name="Planned").count())
+
+    def test_unhashable_status_query_is_not_cached(self):
+        """Test that status queries with unhashable values are looked up for each cable."""
+        design = self.load_design("cable_connections_shared_status.yaml")
+        for interface in design["devices"][1]["interfaces"]:
+            interface["!connect_cable"]["status__name"] = {"iexact": "planned"}
+        self.assertEqual(2, self.implement_design(design))
+        self.assertEqual(2, Cable.objects.filter(status__name="Planned").count())
+
+    def test_unknown_status(self):
+        """Test that an unknown cable status is reported from the connecting interface."""
+        design = self.load_design("cable_connections.yaml")
+        design["devices"][1]["interfaces"][0]["!connect_cable"]["status__name"] = "Unknown Cable Status"
+
+        environment = Environment(extensions=[CableConnectionExtension])
+        with self.assertRaises(DoesNotExistError) as context:
+            environment.implement_design(design=design, commit=False)
+
+        # The status is looked up from the interface that the cable is connected from
+        error = context.exception
+        self.assertIs(Status, error.model.model_class)
+        self.assertIs(Interface, error.model._design_instance_parent.model_class)  # pylint:disable=protected-access
@@ -876,15 +876,11 @@ class Environment:
         if isinstance(value, str):
             value = self.resolve_value(value)
         elif isinstance(value, list):
-            # copy the list so we don't change the input
-            value = list(value)
-            for i, item in enumerate(value):
-                value[i] = self.resolve_value(item)
+            # build a new list so we don't change the input
+            value = [self.resolve_value(item) for item in value]
         elif isinstance(value, dict):
-            # copy the dict so we don't change the input
-            value = dict(value)
-            for k, item in value.items():
-                value[k] = self.resolve_value(item)
+            # build a new dict so we don't change the input
+            value = {k: self.resolve_value(item) for k, item in value.items()}
         return value
 
     # IDEA: rename to `_create_or_import_objects` to better reflect the import mode
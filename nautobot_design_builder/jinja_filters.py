@@ -1,7 +1,8 @@
 """Useful jinja2 filters for designs."""
 
+from functools import lru_cache
 import json
-from typing import Any
+from typing import Any, Tuple
 from django_jinja import library
 from netaddr import AddrFormatError, IPNetwork
 import yaml
@@ -63,33 +64,45 @@ def network_offset(prefix: str, offset: str) -> IPNetwork:
         prefix (str): Prefix string in the form x.x.x.x/x
         offset (str): Prefix string in the form x.x.x.x/x
 
+    Raises:
+        AddrFormatError: If either input is invalid, or the prefix and offset
+        are different IP versions.
+
+        IndexError: If the result is outside of the address space.
+
     Returns:
         IPNetwork: Returns an IPNetwork that is the result of prefix + offset. The
         returned network object's prefix will be set to the longer prefix length
         between the two inputs.
     """
     try:
-        prefix = IPNetwork(prefix)
+        prefix_value, prefix_length, version = _parse_network(str(prefix))
     except AddrFormatError:
         # pylint: disable=raise-missing-from
         raise AddrFormatError(f"Invalid prefix {prefix}")
 
     try:
-        offset = IPNetwork(offset)
+        offset_value, offset_length, offset_version = _parse_network(str(offset))
     except AddrFormatError:
         # pylint: disable=raise-missing-from
         raise AddrFormatError(f"Invalid offset {offset}")
 
-    # netaddr overloads the + operator to sum
-    # each octet of a pair of addresses. For instance,
-    # 1.1.1.1 + 1.2.3.4 = 2.3.4.5
-    # The result of the expression is a netaddr.IPAddress
-    new_prefix = IPNetwork(prefix.ip + offset.ip)
-    if prefix.prefixlen > offset.prefixlen:
-        new_prefix.prefixlen = prefix.prefixlen
-    else:
-        new_prefix.prefixlen = offset.prefixlen
-    return new_prefix
+    if offset_version != version:
+        raise AddrFormatError(f"Offset {offset} is not the same IP version as prefix {prefix}")
+
+    # The offset is added to the prefix as an integer, so
+    # 1.1.1.1 + 1.2.3.4 = 2.3.4.5 (with carry between octets)
+    value = prefix_value + offset_value
+    if value >= 1 << (32 if version == 4 else 128):
+        raise IndexError("result outside valid IP address boundary!")
+    return IPNetwork((value, max(prefix_length, offset_length)), version=version)
+
+
+@lru_cache(maxsize=4096)
+def _parse_network(network: str) -> Tuple[int, int, int]:
+    """Parse a network string into its integer address, prefix length and IP version."""
+    network = IPNetwork(network)
+    return int(network.ip), network.prefixlen, network.version
 
 
 def _json_default(value: Any):
@@ -1,6 +1,5 @@
 """Signal handlers that fire on various Django model signals."""
 
-from itertools import chain
 import logging
 
 from django.apps import apps
@@ -18,6 +17,18 @@ from . import choices
 
 _LOGGER = logging.getLogger(__name__)
 
+_DEPLOYMENT_STATUS_COLORS = {
+    "Active": ColorChoices.COLOR_GREEN,
+    "Decommissioned": ColorChoices.COLOR_GREY,
+    "Disabled": ColorChoices.COLOR_GREY,
+    "Unknown": ColorChoices.COLOR_DARK_RED,
+}
+
+# Status name to color for every deployment status choice
+_DEPLOYMENT_STATUSES = {
+    status_name: _DEPLOYMENT_STATUS_COLORS[status_name] for _, status_name in choices.DeploymentStatusChoices
+}
+
 
 @receiver(nautobot_database_ready, sender=apps.get_app_config("nautobot_design_builder"))
 def create_design_model_for_existing(sender, **kwargs):
@@ -35,14 +46,14 @@ def create_design_model_for_existing(sender, **kwargs):
 def create_deployment_statuses(**kwargs):
     """Create a default set of statuses for design deployments."""
     content_type = ContentType.objects.get_for_model(Deployment)
-    color_mapping = {
-        "Active": ColorChoices.COLOR_GREEN,
-        "Decommissioned": ColorChoices.COLOR_GREY,
-        "Disabled": ColorChoices.COLOR_GREY,
-        "Unknown": ColorChoices.COLOR_DARK_RED,
-    }
-    for _, status_name in chain(choices.DeploymentStatusChoices):
-        status, _ = Status.objects.get_or_create(name=status_name, defaults={"color": color_mapping[status_name]})
+    existing = set(Status.objects.filter(name__in=_DEPLOYMENT_STATUSES.keys()).values_list("name", flat=True))
+    # Another worker may be creating the same statuses, they are read back below
+    Status.objects.bulk_create(
+        [Status(name=name, color=color) for name, color in _DEPLOYMENT_STATUSES.items() if name not in existing],
+        ignore_conflicts=True,
+    )
+
+    for status in Status.objects.filter(name__in=_DEPLOYMENT_STATUSES.keys()):
         status.content_types.add(content_type)
 
 
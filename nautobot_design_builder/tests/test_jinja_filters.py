@@ -0,0 +1,32 @@
+"""Unit tests for the design jinja2 filters."""
+
+import unittest
+
+from netaddr import AddrFormatError, IPNetwork
+
+from nautobot_design_builder.jinja_filters import network_offset
+
+
+class TestNetworkOffset(unittest.TestCase):
+    """Test the network_offset filter."""
+
+    def test_offset(self):
+        self.assertEqual(IPNetwork("1.1.1.1/16"), network_offset("1.1.0.0/16", "0.0.1.1/16"))
+
+    def test_longer_offset_prefix_length(self):
+        self.assertEqual(IPNetwork("1.1.1.0/24"), network_offset("1.1.0.0/16", "0.0.1.0/24"))
+
+    def test_ipv6_offset(self):
+        self.assertEqual(IPNetwork("2001:db8::1/64"), network_offset("2001:db8::/32", "::1/64"))
+
+    def test_overflow(self):
+        self.assertRaises(IndexError, network_offset, "255.255.255.0/24", "0.0.1.0/24")
+        self.assertRaises(IndexError, network_offset, "ffff:ffff:ffff:ffff:ffff:ffff:ffff:ff00/120", "::100")
+
+    def test_mixed_ip_versions(self):
+        self.assertRaises(AddrFormatError, network_offset, "2001:db8::/32", "0.0.0.1/24")
+        self.assertRaises(AddrFormatError, network_offset, "10.0.0.0/8", "::1/64")
+
+    def test_invalid_input(self):
+        self.assertRaises(AddrFormatError, network_offset, "not a prefix", "0.0.0.1")
+        self.assertRaises(AddrFormatError, network_offset, "10.0.0.0/8", "not an offset")
@@ -14,14 +14,21 @@ from .. import models, choices
 class BaseDeploymentTest(BaseDesignTest):
     """Base fixtures for tests using design deployments."""
 
-    @staticmethod
-    def create_deployment(design_name, design):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.deployment_content_type = ContentType.objects.get_for_model(models.Deployment)
+        cls.active_status = Status.objects.get(
+            content_types=cls.deployment_content_type, name=choices.DeploymentStatusChoices.ACTIVE
+        )
+
+    @classmethod
+    def create_deployment(cls, design_name, design):
         """Generate a Deployment."""
-        content_type = ContentType.objects.get_for_model(models.Deployment)
         deployment = models.Deployment(
             design=design,
             name=design_name,
-            status=Status.objects.get(content_types=content_type, name=choices.DeploymentStatusChoices.ACTIVE),
+            status=cls.active_status,
             version=design.version,
         )
         deployment.validated_save()
@@ -31,17 +31,25 @@ def create_test_view_data():
         test_designs.SimpleDesignReport,
         test_designs.IntegrationDesign,
     ]
+    # Every test class calls this from setUpTestData, so look up the shared
+    # objects once instead of once per job class.
+    jobs = {
+        (job.module_name, job.job_class_name): job
+        for job in Job.objects.filter(job_class_name__in=[job_class.__name__ for job_class in job_classes])
+    }
+    designs = {design.job_id: design for design in Design.objects.filter(job__in=jobs.values())}
+    active_status = Status.objects.get(name="Active")
     for i, job_class in enumerate(job_classes, 1):
         # Core models
-        job = Job.objects.get(module_name=job_class.__module__, job_class_name=job_class.__name__)
+        job = jobs[(job_class.__module__, job_class.__name__)]
         job_result = JobResult.objects.create(name=f"Test Result {i}", job_model=job)
         object_created_by_job = Tenant.objects.create(name=f"Tenant {i}")
 
         # Design Builder models
         instance = Deployment.objects.create(
-            design=Design.objects.get(job_id=job.id),
+            design=designs[job.id],
             name=f"Test Instance {i}",
-            status=Status.objects.get(name="Active"),
+            status=active_status,
         )
         change_set = ChangeSet.objects.create(deployment=instance, job_result=job_result)
         full_control = i == 1  # Have one record where full control is given, more than one where its not.
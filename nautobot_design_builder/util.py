@@ -348,18 +348,15 @@ def get_created_and_last_updated_usernames_for_model(instance):
     from nautobot.extras.choices import ObjectChangeActionChoices
     from nautobot.extras.models import ObjectChange
 
-    object_change_records = get_changes_for_model(instance)
+    # Only the user names are needed, so don't load the object data of each change
+    user_names = get_changes_for_model(instance).values_list("user_name", flat=True)
     created_by = None
-    last_updated_by = None
     try:
-        created_by_record = object_change_records.get(action=ObjectChangeActionChoices.ACTION_CREATE)
-        created_by = created_by_record.user_name
+        created_by = user_names.get(action=ObjectChangeActionChoices.ACTION_CREATE)
     except ObjectChange.DoesNotExist:
         pass
 
-    last_updated_by_record = object_change_records.order_by("time").last()
-    if last_updated_by_record:
-        last_updated_by = last_updated_by_record.user_name
+    last_updated_by = user_names.order_by("time").last()
 
     return created_by, last_updated_by
 